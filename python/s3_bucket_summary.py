@@ -2,23 +2,218 @@ import os
 import boto3
 import csv
 import datetime
-import signal
+import gzip
+import time
+import io
+import json
 import sys
 import configparser
-from collections import defaultdict
+import itertools
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError, ProfileNotFound
 
 class TimeoutException(Exception):
     pass
 
-def timeout_handler(signum, frame):
-    raise TimeoutException("Operation timed out while processing buckets")
+# CloudWatch publishes daily BucketSizeBytes metrics per storage type; map the
+# StorageType dimension values back to the S3 storage class names used in
+# ListObjectsV2 responses so both code paths report the same class names.
+CLOUDWATCH_STORAGE_TYPES = {
+    'StandardStorage': 'STANDARD',
+    'StandardIAStorage': 'STANDARD_IA',
+    'OneZoneIAStorage': 'ONEZONE_IA',
+    'ReducedRedundancyStorage': 'REDUCED_REDUNDANCY',
+    'GlacierInstantRetrievalStorage': 'GLACIER_IR',
+    'GlacierStorage': 'GLACIER',
+    'DeepArchiveStorage': 'DEEP_ARCHIVE',
+    'IntelligentTieringFAStorage': 'INTELLIGENT_TIERING',
+    'IntelligentTieringIAStorage': 'INTELLIGENT_TIERING',
+    'IntelligentTieringAAStorage': 'INTELLIGENT_TIERING',
+    'IntelligentTieringAIAStorage': 'INTELLIGENT_TIERING',
+    'IntelligentTieringDAAStorage': 'INTELLIGENT_TIERING',
+    'ExpressOneZone': 'EXPRESS_ONEZONE',
+}
+
+# The same handful of storage-class strings repeats for every object, but
+# botocore's parser materializes a fresh string each time. Re-keying tallies
+# onto these interned instances turns every later merge and report lookup
+# into a pointer-equality dict probe.
+_SC_INTERN = {s: sys.intern(s) for s in (
+    'STANDARD', 'STANDARD_IA', 'ONEZONE_IA', 'GLACIER', 'DEEP_ARCHIVE',
+    'INTELLIGENT_TIERING', 'GLACIER_IR', 'REDUCED_REDUNDANCY', 'OUTPOSTS',
+    'EXPRESS_ONEZONE')}
+
+def _intern_class_counter(counter):
+    """Re-key a per-class Counter onto the interned class strings.
+
+    Classes not in the intern table (e.g. ones newer than this script)
+    keep their original key rather than being mislabeled.
+    """
+    return Counter({_SC_INTERN.get(k, k): v for k, v in counter.items()})
+
+def _check_deadline(deadline):
+    """Raise TimeoutException once the monotonic deadline has passed."""
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutException("Operation timed out while processing buckets")
+
+def _latest_datapoint(response):
+    """Return the most recent datapoint value from a GetMetricStatistics response, or None."""
+    datapoints = response.get('Datapoints', [])
+    if not datapoints:
+        return None
+    latest = max(datapoints, key=lambda dp: dp['Timestamp'])
+    return int(latest['Average'])
+
+def _summarize_bucket_via_cloudwatch(session, bucket_name, region=None):
+    """Summarize a bucket from CloudWatch storage metrics instead of listing objects.
+
+    S3 publishes BucketSizeBytes (per storage type) and NumberOfObjects metrics
+    to CloudWatch once a day, so a handful of GetMetricStatistics calls replaces
+    a full ListObjectsV2 enumeration of the bucket. The metrics only exist in
+    the bucket's home region's CloudWatch, so pass the resolved bucket region.
+
+    Per-storage-class byte totals are exact; per-class object counts are not
+    available from CloudWatch, so they are estimated from each class's share
+    of the total bytes.
+
+    Returns:
+        tuple: (object_count, total_size, class_counts, class_bytes) or None
+               if CloudWatch has no metrics for the bucket yet (e.g. a
+               brand-new bucket).
+    """
+    cloudwatch = _get_client(session, 'cloudwatch', region)
+    end_time = datetime.datetime.utcnow()
+    start_time = end_time - datetime.timedelta(days=2)
+    common_args = {
+        'Namespace': 'AWS/S3',
+        'Statistics': ['Average'],
+        'Period': 86400,
+        'StartTime': start_time,
+        'EndTime': end_time,
+    }
+
+    object_count = _latest_datapoint(cloudwatch.get_metric_statistics(
+        MetricName='NumberOfObjects',
+        Dimensions=[
+            {'Name': 'BucketName', 'Value': bucket_name},
+            {'Name': 'StorageType', 'Value': 'AllStorageTypes'},
+        ],
+        **common_args
+    ))
+    if object_count is None:
+        return None
+
+    total_size = 0
+    class_bytes = defaultdict(int)
+    for storage_type, storage_class in CLOUDWATCH_STORAGE_TYPES.items():
+        size = _latest_datapoint(cloudwatch.get_metric_statistics(
+            MetricName='BucketSizeBytes',
+            Dimensions=[
+                {'Name': 'BucketName', 'Value': bucket_name},
+                {'Name': 'StorageType', 'Value': storage_type},
+            ],
+            **common_args
+        ))
+        if size:
+            class_bytes[storage_class] += size
+            total_size += size
+
+    # Estimate per-class object counts from each class's byte share.
+    class_counts = Counter()
+    if total_size > 0:
+        for storage_class, size in class_bytes.items():
+            class_counts[storage_class] = int(round(object_count * (size / total_size)))
+    elif object_count > 0:
+        class_counts['STANDARD'] = object_count
+        class_bytes['STANDARD'] = 0
+
+    return object_count, total_size, class_counts, Counter(class_bytes)
+
+def _summarize_bucket_via_inventory(session, bucket_name, inventory_bucket, inventory_prefix):
+    """Summarize a bucket from its most recent S3 Inventory report.
+
+    S3 Inventory delivers a daily manifest plus CSV/Parquet data files
+    listing every object with its Size and StorageClass, so summarizing a
+    bucket costs one manifest read and a few data-file downloads instead
+    of O(objects) ListObjectsV2 calls. Parquet reports require pyarrow.
+
+    Args:
+        session: boto3 session.
+        bucket_name (str): Source bucket the inventory describes.
+        inventory_bucket (str): Bucket the inventory reports are delivered to.
+        inventory_prefix (str): Delivery prefix configured for the inventory.
+
+    Returns:
+        tuple: (object_count, total_size, class_counts, class_bytes) or None
+               if no manifest exists for the bucket.
+    """
+    s3 = _get_client(session, 's3')
+
+    # Reports land under <prefix>/<source-bucket>/<config-id>/<timestamp>/manifest.json;
+    # the timestamped paths sort chronologically, so the max key is the newest run.
+    search_prefix = f"{inventory_prefix.rstrip('/')}/{bucket_name}/" if inventory_prefix else f"{bucket_name}/"
+    paginator = s3.get_paginator('list_objects_v2')
+    manifest_keys = [
+        obj['Key']
+        for page in paginator.paginate(Bucket=inventory_bucket, Prefix=search_prefix)
+        for obj in page.get('Contents', [])
+        if obj['Key'].endswith('/manifest.json')
+    ]
+    if not manifest_keys:
+        return None
+
+    manifest_obj = s3.get_object(Bucket=inventory_bucket, Key=max(manifest_keys))
+    manifest = json.load(manifest_obj['Body'])
+    file_format = manifest.get('fileFormat', '')
+
+    object_count = 0
+    total_size = 0
+    class_counts = Counter()
+    class_bytes = Counter()
+
+    for data_file in manifest.get('files', []):
+        body = s3.get_object(Bucket=inventory_bucket, Key=data_file['key'])['Body']
+
+        if file_format == 'Parquet':
+            import pyarrow.parquet as pq  # Only needed for Parquet-format inventories
+            table = pq.read_table(io.BytesIO(body.read()), columns=['size', 'storage_class'])
+            grouped = table.group_by('storage_class').aggregate([('size', 'sum'), ('size', 'count')])
+            for storage_class, class_size, class_count in zip(
+                    grouped['storage_class'].to_pylist(),
+                    grouped['size_sum'].to_pylist(),
+                    grouped['size_count'].to_pylist()):
+                class_counts[storage_class or 'STANDARD'] += class_count
+                class_bytes[storage_class or 'STANDARD'] += class_size or 0
+                total_size += class_size or 0
+                object_count += class_count
+        elif file_format == 'CSV':
+            # CSV data files are gzipped and have no header row; column order
+            # comes from the manifest's fileSchema.
+            schema = [column.strip() for column in manifest.get('fileSchema', '').split(',')]
+            size_index = schema.index('Size')
+            class_index = schema.index('StorageClass') if 'StorageClass' in schema else None
+            reader = csv.reader(io.TextIOWrapper(gzip.GzipFile(fileobj=body), newline=''))
+            for row in reader:
+                size = int(row[size_index]) if row[size_index] else 0
+                storage_class = (row[class_index] if class_index is not None else '') or 'STANDARD'
+                object_count += 1
+                total_size += size
+                class_counts[storage_class] += 1
+                class_bytes[storage_class] += size
+        else:
+            raise ValueError(f"Unsupported inventory file format: {file_format!r}")
+
+    return object_count, total_size, class_counts, class_bytes
 
 def format_duration(seconds):
     """Format duration in seconds to a human-readable string."""
-    minutes, seconds = divmod(int(seconds), 60)
-    hours, minutes = divmod(minutes, 60)
-    
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+
     if hours > 0:
         return f"{hours}h {minutes}m {seconds}s"
     elif minutes > 0:
@@ -49,23 +244,356 @@ def get_aws_session(profile_name=None):
         print(f"AWS API error: {e}")
         return None, None
 
-def get_s3_summary(profile_name=None, timeout_minutes=15):
+# Number of buckets processed concurrently. The workload is I/O-bound on
+# HTTPS round-trips, so threads overlap network latency across buckets.
+MAX_BUCKET_WORKERS = 16
+
+# Number of key prefixes enumerated concurrently across all buckets.
+# ListObjectsV2 is strictly serial within a prefix (~1000 keys per page),
+# so fanning out one paginator per top-level prefix is the only way to
+# speed up a full enumeration.
+MAX_PREFIX_WORKERS = 32
+
+# Shared client tuning. botocore's default pool of 10 connections would
+# quietly serialize the thread pools above behind pool-exhaustion queueing,
+# so size it past the combined worker count; adaptive retries back off on
+# their own when S3 answers 503 SlowDown under high fan-out.
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+# boto3 clients are not thread-safe, so each worker thread gets its own.
+_thread_local = threading.local()
+
+# Serializes client creation: the shared boto3 Session is not thread-safe
+# either, and concurrent session.client() calls race in its loader caches.
+_client_creation_lock = threading.Lock()
+
+# Serializes console output from worker threads so progress lines don't interleave.
+_print_lock = threading.Lock()
+
+def _get_client(session, service, region_name=None):
+    """Return a boto3 client for the given service, cached per thread.
+
+    When region_name is given the client is pinned to that region's
+    endpoint (virtual-hosted addressing), avoiding the 301-redirect
+    round-trip S3 answers with when a request hits the wrong region.
+    """
+    clients = getattr(_thread_local, 'clients', None)
+    if clients is None:
+        clients = _thread_local.clients = {}
+    key = (service, region_name)
+    if key not in clients:
+        config = CLIENT_CONFIG
+        if service == 's3' and region_name:
+            config = config.merge(Config(s3={'addressing_style': 'virtual'}))
+        with _client_creation_lock:
+            if region_name:
+                clients[key] = session.client(service, region_name=region_name, config=config)
+            else:
+                clients[key] = session.client(service, config=config)
+    return clients[key]
+
+# Bucket regions never change, so lookups are memoized for the whole run
+# and shared across worker threads (unlike clients, plain data is safe to share).
+_bucket_regions = {}
+_bucket_regions_lock = threading.Lock()
+
+def _get_bucket_region(session, bucket_name):
+    """Resolve a bucket's region via HeadBucket, memoized across threads.
+
+    Returns None when the region cannot be determined (e.g. AccessDenied
+    with no region header); callers then fall back to the session's
+    default-region client.
+    """
+    with _bucket_regions_lock:
+        if bucket_name in _bucket_regions:
+            return _bucket_regions[bucket_name]
+
+    s3 = _get_client(session, 's3')
+    region = None
+    try:
+        response = s3.head_bucket(Bucket=bucket_name)
+        headers = response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+        region = headers.get('x-amz-bucket-region')
+    except ClientError as e:
+        # Even 301/403 responses carry the region header, which is exactly
+        # the case where pinning matters (bucket in another region).
+        headers = e.response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+        region = headers.get('x-amz-bucket-region')
+
+    with _bucket_regions_lock:
+        _bucket_regions[bucket_name] = region
+    return region
+
+# Pool shared by all buckets for per-prefix enumeration, created on first use.
+_prefix_executor = None
+_prefix_executor_lock = threading.Lock()
+
+def _get_prefix_executor():
+    """Return the shared prefix-enumeration thread pool, creating it on first use."""
+    global _prefix_executor
+    with _prefix_executor_lock:
+        if _prefix_executor is None:
+            _prefix_executor = ThreadPoolExecutor(max_workers=MAX_PREFIX_WORKERS)
+        return _prefix_executor
+
+def _enumerate_prefix(session, bucket_name, prefix, region=None, deadline=None):
+    """Enumerate all objects under one key prefix.
+
+    Returns:
+        tuple: (object_count, total_size, class_counts, class_bytes).
+    """
+    s3 = _get_client(session, 's3', region)
+    paginator = s3.get_paginator('list_objects_v2')
+    object_count = 0
+    total_size = 0
+    class_counts = Counter()
+    class_bytes = Counter()
+
+    # Project each object down to the two fields we consume; the JMESPath
+    # search yields flat [Size, StorageClass] pairs instead of materializing
+    # a full per-object dict on the Python side.
+    # Ask for full 1000-key pages and no Owner field so each round-trip
+    # carries the maximum number of objects with the least XML to parse.
+    pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix, FetchOwner=False,
+                               PaginationConfig={'PageSize': 1000})
+    pairs = pages.search('Contents[].[Size, StorageClass]')
+
+    # Reduce in page-sized batches: splitting each chunk into parallel
+    # size/class columns lets zip(), sum() and Counter.update() do the
+    # per-object work in C instead of Python bytecode.
+    while True:
+        _check_deadline(deadline)
+        chunk = list(itertools.islice(pairs, 1000))
+        if not chunk:
+            break
+        # A page with no Contents yields a bare None into the pair stream
+        # (PageIterator.search passes non-list JMESPath results through).
+        chunk = [pair for pair in chunk if pair is not None]
+        if not chunk:
+            continue
+        sizes, classes = zip(*chunk)
+        chunk_size = sum(sizes)
+        object_count += len(chunk)
+        total_size += chunk_size
+        class_counts.update(classes)
+        # Most chunks hold a single storage class, so the per-class byte
+        # sums usually reduce to one addition; mixed chunks pay the loop.
+        distinct = set(classes)
+        if len(distinct) == 1:
+            class_bytes[classes[0]] += chunk_size
+        else:
+            for size, storage_class in chunk:
+                class_bytes[storage_class] += size
+
+    # Objects without an explicit StorageClass arrive as None.
+    if None in class_counts:
+        class_counts['STANDARD'] += class_counts.pop(None)
+        class_bytes['STANDARD'] += class_bytes.pop(None, 0)
+
+    return (object_count, total_size,
+            _intern_class_counter(class_counts), _intern_class_counter(class_bytes))
+
+def _enumerate_bucket(session, bucket_name, bucket_start, region=None, deadline=None):
+    """Fully enumerate a bucket, fanning out across its top-level prefixes.
+
+    A probe with Delimiter='/' discovers the top-level CommonPrefixes (and
+    counts any keys that sit directly at the root). Each prefix is then
+    enumerated on the shared prefix pool and the partial results are merged,
+    so a bucket with K balanced prefixes lists roughly K times faster than
+    a single serial paginator.
+
+    Returns:
+        tuple: (object_count, total_size, class_counts, class_bytes).
+    """
+    s3 = _get_client(session, 's3', region)
+    paginator = s3.get_paginator('list_objects_v2')
+
+    object_count = 0
+    total_size = 0
+    class_counts = Counter()
+    class_bytes = Counter()
+    prefixes = []
+
+    # The probe also pages through root-level keys, so a bucket with no
+    # top-level prefixes is fully enumerated by the probe alone.
+    for page in paginator.paginate(Bucket=bucket_name, Delimiter='/', FetchOwner=False,
+                                   PaginationConfig={'PageSize': 1000}):
+        _check_deadline(deadline)
+        for cp in page.get('CommonPrefixes', []):
+            prefixes.append(cp['Prefix'])
+        for obj in page.get('Contents', []):
+            raw_class = obj.get('StorageClass') or 'STANDARD'
+            storage_class = _SC_INTERN.get(raw_class, raw_class)
+            object_count += 1
+            total_size += obj['Size']
+            class_counts[storage_class] += 1
+            class_bytes[storage_class] += obj['Size']
+
+    if prefixes:
+        executor = _get_prefix_executor()
+        futures = [
+            executor.submit(_enumerate_prefix, session, bucket_name, prefix, region, deadline)
+            for prefix in prefixes
+        ]
+        done_prefixes = 0
+        last_update = time.monotonic()
+        for future in as_completed(futures):
+            prefix_count, prefix_size, prefix_counts, prefix_bytes = future.result()
+            object_count += prefix_count
+            total_size += prefix_size
+            class_counts += prefix_counts
+            class_bytes += prefix_bytes
+            done_prefixes += 1
+
+            # Show progress every 5 seconds
+            now = time.monotonic()
+            if now - last_update >= 5:
+                elapsed = now - bucket_start
+                rate = object_count / elapsed if elapsed > 0 else 0
+                with _print_lock:
+                    print(f"  {bucket_name}: processed {object_count:,} objects, "
+                          f"{done_prefixes}/{len(prefixes)} prefixes ({rate:,.1f} objects/sec)")
+                last_update = now
+
+    return object_count, total_size, class_counts, class_bytes
+
+def _build_summary_entry(bucket_name, object_count, total_size, class_counts, class_bytes):
+    """Assemble one bucket's summary entry with exact per-class counts and bytes."""
+    return {
+        'Bucket Name': bucket_name,
+        'Object Count': object_count,
+        'Total Size (Bytes)': total_size,
+        'Storage Classes': {
+            storage_class: {'count': count, 'bytes': class_bytes.get(storage_class, 0)}
+            for storage_class, count in class_counts.items()
+        }
+    }
+
+def _list_buckets(s3, region=None):
+    """List the account's buckets, filtered server-side by region when given.
+
+    Pushing the BucketRegion filter to S3 means out-of-scope buckets are
+    never returned at all, instead of being fetched and discarded after a
+    per-bucket region lookup.
+    """
+    buckets = []
+    kwargs = {'MaxBuckets': 1000}
+    if region:
+        kwargs['BucketRegion'] = region
+    while True:
+        response = s3.list_buckets(**kwargs)
+        buckets.extend(response.get('Buckets', []))
+        token = response.get('ContinuationToken')
+        if not token:
+            break
+        kwargs['ContinuationToken'] = token
+    return buckets
+
+def _process_bucket(session, bucket_name, inventory_bucket=None, inventory_prefix='',
+                    deadline=None, region=None):
+    """Summarize a single bucket (inventory, then CloudWatch, then enumeration).
+
+    Runs inside a worker thread and uses thread-local boto3 clients.
+    Raises TimeoutException if the run's deadline passes mid-bucket.
+
+    Returns:
+        dict: Summary entry for the bucket, or None if it was inaccessible.
+    """
+    bucket_start = time.monotonic()
+    _check_deadline(deadline)
+
+    # A caller-supplied region (e.g. from a region-filtered listing) skips
+    # the HeadBucket lookup; otherwise resolve the bucket's home region once
+    # so every call goes straight to the regional endpoint instead of
+    # bouncing off a redirect.
+    if region is None:
+        region = _get_bucket_region(session, bucket_name)
+
+    # An S3 Inventory report, when configured, is the cheapest source of
+    # exact per-object data: one manifest read and a few file downloads.
+    if inventory_bucket:
+        inventory_summary = None
+        try:
+            inventory_summary = _summarize_bucket_via_inventory(
+                session, bucket_name, inventory_bucket, inventory_prefix)
+        except (ClientError, ImportError, ValueError) as e:
+            with _print_lock:
+                print(f"Warning: Could not use inventory for {bucket_name}: {e}")
+        if inventory_summary is not None:
+            object_count, total_size, class_counts, class_bytes = inventory_summary
+            bucket_time = time.monotonic() - bucket_start
+            with _print_lock:
+                print(f"  {bucket_name}: summarized {object_count:,} objects from S3 Inventory in {format_duration(bucket_time)}")
+            return _build_summary_entry(bucket_name, object_count, total_size, class_counts, class_bytes)
+
+    # Prefer the aggregated CloudWatch storage metrics: a few
+    # GetMetricStatistics calls instead of one ListObjectsV2 page per
+    # 1000 objects. Fall back to enumeration when metrics are missing
+    # (brand-new bucket) or CloudWatch is not accessible.
+    cloudwatch_summary = None
+    try:
+        cloudwatch_summary = _summarize_bucket_via_cloudwatch(session, bucket_name, region)
+    except ClientError as e:
+        with _print_lock:
+            print(f"Warning: CloudWatch metrics unavailable for {bucket_name}: {e}")
+
+    if cloudwatch_summary is not None:
+        object_count, total_size, class_counts, class_bytes = cloudwatch_summary
+        bucket_time = time.monotonic() - bucket_start
+        with _print_lock:
+            print(f"  {bucket_name}: summarized {object_count:,} objects from CloudWatch metrics in {format_duration(bucket_time)}")
+        return _build_summary_entry(bucket_name, object_count, total_size, class_counts, class_bytes)
+
+    with _print_lock:
+        print(f"  {bucket_name}: no CloudWatch metrics found, enumerating objects...")
+
+    try:
+        object_count, total_size, class_counts, class_bytes = _enumerate_bucket(
+            session, bucket_name, bucket_start, region, deadline)
+    except ClientError as e:
+        with _print_lock:
+            print(f"Warning: Could not fully access bucket {bucket_name}: {e}")
+        return None
+
+    bucket_time = time.monotonic() - bucket_start
+    with _print_lock:
+        print(f"  {bucket_name}: processed {object_count:,} objects in {format_duration(bucket_time)}")
+
+    return _build_summary_entry(bucket_name, object_count, total_size, class_counts, class_bytes)
+
+def get_s3_summary(profile_name=None, timeout_minutes=15, max_workers=MAX_BUCKET_WORKERS,
+                   inventory_bucket=None, inventory_prefix='', region=None):
     """Get S3 bucket summary using AWS credentials.
-    
+
     Args:
         profile_name (str, optional): AWS profile name to use. Defaults to None (uses default profile).
         timeout_minutes (int, optional): Maximum time to spend processing (in minutes). Defaults to 15.
-    
+        max_workers (int, optional): Number of buckets to process concurrently.
+            The work is I/O-bound, so accounts with many buckets can raise this
+            well past the default to keep more requests in flight.
+        inventory_bucket (str, optional): Bucket receiving S3 Inventory reports.
+            When set, buckets with a report there are summarized from it
+            instead of being queried live.
+        inventory_prefix (str, optional): Delivery prefix for the inventory reports.
+        region (str, optional): Only summarize buckets in this region. The
+            filter is applied server-side by ListBuckets, so out-of-scope
+            buckets are never even returned.
+
     Returns:
         tuple: (summary_data, account_id) where summary_data is the list of bucket summaries
                and account_id is the AWS account number.
     """
     try:
-        # Set up timeout handler
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout_minutes * 60)  # Convert minutes to seconds
-        
-        start_time = datetime.datetime.now()
+        # A monotonic deadline is checked at bucket and page boundaries;
+        # unlike SIGALRM it works off the main thread and on any platform.
+        start_time = time.monotonic()
+        deadline = start_time + timeout_minutes * 60
         processed_buckets = 0
         
         # Get AWS session
@@ -77,68 +605,53 @@ def get_s3_summary(profile_name=None, timeout_minutes=15):
         account_id = getattr(session, 'account_id', 'N/A')
                 
         # Create S3 client using the session
-        s3 = session.client('s3')
-        buckets = s3.list_buckets()['Buckets']
+        s3 = session.client('s3', config=CLIENT_CONFIG)
+        buckets = _list_buckets(s3, region)
         total_buckets = len(buckets)
         
         print(f"Found {total_buckets} buckets to process...")
         summary = []
 
-        for i, bucket in enumerate(buckets, 1):
-            bucket_name = bucket['Name']
-            bucket_start = datetime.datetime.now()
-            print(f"\n[{i}/{total_buckets}] Processing bucket: {bucket_name}")
-            
-            paginator = s3.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(Bucket=bucket_name)
-
-            object_count = 0
-            total_size = 0
-            storage_classes = defaultdict(int)
-            last_update = datetime.datetime.now()
-
-            try:
-                for page in page_iterator:
-                    if 'Contents' in page:
-                        for obj in page['Contents']:
-                            object_count += 1
-                            total_size += obj['Size']
-                            storage_class = obj.get('StorageClass', 'STANDARD')
-                            storage_classes[storage_class] += 1
-                            
-                            # Show progress every 1000 objects or 5 seconds, whichever comes first
-                            current_time = datetime.datetime.now()
-                            if object_count % 1000 == 0 or (current_time - last_update).total_seconds() >= 5:
-                                elapsed = (current_time - bucket_start).total_seconds()
-                                rate = object_count / elapsed if elapsed > 0 else 0
-                                print(f"  Processed {object_count:,} objects ({rate:,.1f} objects/sec)", end='\r')
-                                last_update = current_time
-                                
-            except ClientError as e:
-                print(f"\nWarning: Could not fully access bucket {bucket_name}: {e}")
-                # Continue with partial data if we got any
-                if object_count == 0:
+        # Process buckets concurrently: the work is dominated by HTTPS
+        # round-trips, so overlapping requests across buckets gives a
+        # near-linear speedup up to the worker count.
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(_process_bucket, session, bucket['Name'],
+                                inventory_bucket, inventory_prefix, deadline,
+                                region): bucket['Name']
+                for bucket in buckets
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                bucket_name = futures[future]
+                if time.monotonic() > deadline:
+                    raise TimeoutException("Operation timed out while processing buckets")
+                try:
+                    entry = future.result()
+                except TimeoutException:
+                    raise
+                except Exception as e:
+                    with _print_lock:
+                        print(f"Warning: Failed to process bucket {bucket_name}: {e}")
                     continue
-            
-            bucket_time = (datetime.datetime.now() - bucket_start).total_seconds()
-            print(f"  Processed {object_count:,} objects in {format_duration(bucket_time)}")
-            
-            summary.append({
-                'Bucket Name': bucket_name,
-                'Object Count': object_count,
-                'Total Size (Bytes)': total_size,
-                'Storage Classes': dict(storage_classes)
-            })
-            
-            processed_buckets += 1
-            
-            # Estimate remaining time
-            if i < total_buckets:
-                avg_time_per_bucket = (datetime.datetime.now() - start_time).total_seconds() / i
-                remaining_buckets = total_buckets - i
-                remaining_time = avg_time_per_bucket * remaining_buckets
-                print(f"Estimated time remaining: {format_duration(remaining_time)}")
-                
+                if entry is None:
+                    continue
+                summary.append(entry)
+                processed_buckets += 1
+
+                # Estimate remaining time
+                if completed < total_buckets:
+                    avg_time_per_bucket = (time.monotonic() - start_time) / completed
+                    remaining_buckets = total_buckets - completed
+                    remaining_time = avg_time_per_bucket * remaining_buckets
+                    with _print_lock:
+                        print(f"[{completed}/{total_buckets}] Estimated time remaining: {format_duration(remaining_time)}")
+        finally:
+            # On timeout, drop any buckets that have not started yet; completed
+            # futures have already been folded into summary.
+            executor.shutdown(wait=False, cancel_futures=True)
+
     except TimeoutException as e:
         print(f"\nWarning: {str(e)} Processed {processed_buckets} out of {total_buckets} buckets.")
         if processed_buckets == 0:
@@ -147,11 +660,8 @@ def get_s3_summary(profile_name=None, timeout_minutes=15):
         print(f"\nError: {str(e)}")
         if processed_buckets == 0:
             return [], None
-    finally:
-        # Disable the alarm
-        signal.alarm(0)
-        
-    total_time = (datetime.datetime.now() - start_time).total_seconds()
+
+    total_time = time.monotonic() - start_time
     print(f"\nProcessed {processed_buckets} buckets in {format_duration(total_time)}")
     
     if not summary:
@@ -160,210 +670,194 @@ def get_s3_summary(profile_name=None, timeout_minutes=15):
     
     return summary, account_id
 
-def write_summary_to_csv(summary, account_id=None, filename='s3_bucket_summary.csv'):
+@dataclass(slots=True)
+class SummaryStats:
+    """Account-wide totals aggregated once from the per-bucket summary."""
+    total_buckets: int = 0
+    total_objects: int = 0
+    total_size: int = 0
+    storage_class_objects: dict = field(default_factory=dict)
+    storage_class_sizes: dict = field(default_factory=dict)
+    largest_bucket: dict = None
+    highest_capacity_bucket: dict = None
+
+def _aggregate(summary):
+    """Fold the per-bucket summary into SummaryStats in a single pass."""
+    stats = SummaryStats(total_buckets=len(summary))
+    storage_class_objects = defaultdict(int)
+    storage_class_sizes = defaultdict(int)
+
+    for entry in summary:
+        stats.total_objects += entry['Object Count']
+        stats.total_size += entry['Total Size (Bytes)']
+        if stats.largest_bucket is None or entry['Object Count'] > stats.largest_bucket['Object Count']:
+            stats.largest_bucket = entry
+        if stats.highest_capacity_bucket is None or entry['Total Size (Bytes)'] > stats.highest_capacity_bucket['Total Size (Bytes)']:
+            stats.highest_capacity_bucket = entry
+
+        storage_classes = entry['Storage Classes']
+        if storage_classes:
+            for sc, info in storage_classes.items():
+                storage_class_objects[sc] += info['count']
+                storage_class_sizes[sc] += info['bytes']
+        else:
+            # If no storage class info, count as STANDARD
+            storage_class_objects['STANDARD'] += entry['Object Count']
+            storage_class_sizes['STANDARD'] += entry['Total Size (Bytes)']
+
+    stats.storage_class_objects = dict(storage_class_objects)
+    stats.storage_class_sizes = dict(storage_class_sizes)
+    return stats
+
+def write_summary_to_csv(summary, account_id=None, filename='s3_bucket_summary.csv', stats=None):
     """Write the S3 bucket summary to a CSV file.
-    
+
     Args:
         summary (list): List of bucket summaries
         account_id (str, optional): AWS account ID
         filename (str, optional): Output filename. Defaults to 's3_bucket_summary.csv'.
+        stats (SummaryStats, optional): Pre-aggregated totals; computed here
+            when not supplied.
+
+    Returns:
+        SummaryStats: The aggregated totals, for reuse by the console report.
     """
-    with open(filename, mode='w', newline='') as file:
+    if stats is None:
+        stats = _aggregate(summary)
+
+    # A 1 MiB write buffer plus writerows batching keeps syscall count low
+    # even for accounts with tens of thousands of buckets.
+    with open(filename, mode='w', newline='', buffering=1 << 20) as file:
         writer = csv.writer(file)
         # Write header
-        writer.writerow(['S3 Bucket Summary Report'])
-        writer.writerow(['Generated at:', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+        header_rows = [
+            ['S3 Bucket Summary Report'],
+            ['Generated at:', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+        ]
         if account_id:
-            writer.writerow(['AWS Account:', account_id])
-        writer.writerow([''])
-        
-        # Write detailed bucket information
-        writer.writerow(['Detailed Bucket Information'])
-        writer.writerow(['Bucket Name', 'Object Count', 'Total Size (Bytes)', 'Storage Classes'])
-
-        # Initialize summary variables
-        total_objects = 0
-        total_size = 0
-        storage_class_objects = defaultdict(int)
-        storage_class_sizes = defaultdict(int)
-        highest_capacity_bucket = None
-        
-        # First pass: collect all storage class sizes
-        for entry in summary:
-            bucket_size = entry['Total Size (Bytes)']
-            bucket_objects = entry['Object Count']
-            storage_classes = entry['Storage Classes']
-            
-            # If we have storage class info, distribute the size proportionally
-            if storage_classes and bucket_objects > 0:
-                for sc, count in storage_classes.items():
-                    storage_class_objects[sc] += count
-                    # Calculate proportional size for each storage class
-                    proportion = count / bucket_objects
-                    storage_class_sizes[sc] += int(bucket_size * proportion)
-            else:
-                # If no storage class info, count as STANDARD
-                storage_class_objects['STANDARD'] += bucket_objects
-                storage_class_sizes['STANDARD'] += bucket_size
-        
-        # Second pass: write bucket details
-        for entry in summary:
-            writer.writerow([
+            header_rows.append(['AWS Account:', account_id])
+        header_rows.append([''])
+        header_rows.append(['Detailed Bucket Information'])
+        header_rows.append(['Bucket Name', 'Object Count', 'Total Size (Bytes)', 'Storage Classes'])
+        writer.writerows(header_rows)
+
+        # Per-bucket rows; the totals were already aggregated above.
+        writer.writerows([
+            [
                 entry['Bucket Name'],
                 entry['Object Count'],
                 entry['Total Size (Bytes)'],
-                '; '.join(f"{k}: {v}" for k, v in entry['Storage Classes'].items())
-            ])
-            
-            # Update summary variables
-            total_objects += entry['Object Count']
-            total_size += entry['Total Size (Bytes)']
-        
+                # A list comprehension here hits str.join's list fast path,
+                # which pre-sizes the output buffer.
+                '; '.join([f"{k}: {v['count']} objects ({v['bytes']} bytes)"
+                           for k, v in entry['Storage Classes'].items()])
+            ]
+            for entry in summary
+        ])
+
         # Write summary section
-        writer.writerow([''])
-        writer.writerow(['Summary'])
-        writer.writerow(['Total Buckets', len(summary)])
-        writer.writerow(['Total Objects', total_objects])
-        writer.writerow(['Total Size (Bytes)', total_size])
-        writer.writerow(['Total Size (GB)', round(total_size / (1024**3), 2)])
-        
-        # Write storage class distribution
-        writer.writerow([''])
-        writer.writerow(['Storage Class Distribution'])
-        for sc in sorted(storage_class_objects.keys()):
-            count = storage_class_objects[sc]
-            size_bytes = storage_class_sizes[sc]
+        summary_rows = [
+            [''],
+            ['Summary'],
+            ['Total Buckets', stats.total_buckets],
+            ['Total Objects', stats.total_objects],
+            ['Total Size (Bytes)', stats.total_size],
+            ['Total Size (GB)', round(stats.total_size / (1024**3), 2)],
+            [''],
+            ['Storage Class Distribution'],
+        ]
+        for sc in sorted(stats.storage_class_objects.keys()):
+            count = stats.storage_class_objects[sc]
+            size_bytes = stats.storage_class_sizes[sc]
             size_gb = size_bytes / (1024**3)
-            writer.writerow([f'  {sc} Objects', count])
-            writer.writerow([f'  {sc} Size (Bytes)', size_bytes])
-            writer.writerow([f'  {sc} Size (GB)', round(size_gb, 2)])
-        
-        # Find highest capacity bucket
-        if summary:
-            highest_capacity_bucket = max(summary, key=lambda x: x['Total Size (Bytes)'])
-        
-        # Store for console output
-        return {
-            'total_buckets': len(summary),
-            'total_objects': total_objects,
-            'total_size': total_size,
-            'storage_class_objects': dict(storage_class_objects),
-            'storage_class_sizes': {k: v for k, v in storage_class_sizes.items()},
-            'highest_capacity_bucket': highest_capacity_bucket
-        }
-        
+            summary_rows.append([f'  {sc} Objects', count])
+            summary_rows.append([f'  {sc} Size (Bytes)', size_bytes])
+            summary_rows.append([f'  {sc} Size (GB)', round(size_gb, 2)])
+        writer.writerows(summary_rows)
+
         # Write bucket statistics
-        if summary:
-            # Find largest bucket by object count
-            largest_bucket = max(summary, key=lambda x: x['Object Count'])
-            
-            # Find highest capacity bucket
-            highest_capacity_bucket = max(summary, key=lambda x: x['Total Size (Bytes)'])
-            
-            # Write largest bucket by object count
-            writer.writerow([''])
-            writer.writerow(['Largest Bucket (by object count)'])
-            writer.writerow(['Bucket Name', largest_bucket['Bucket Name']])
-            writer.writerow(['Object Count', largest_bucket['Object Count']])
-            writer.writerow(['Total Size (Bytes)', largest_bucket['Total Size (Bytes)']])
-            writer.writerow(['Total Size (GB)', round(largest_bucket['Total Size (Bytes)'] / (1024**3), 2)])
-            
-            # Write highest capacity bucket
-            writer.writerow([''])
-            writer.writerow(['Highest Capacity Bucket (by size)'])
-            writer.writerow(['Bucket Name', highest_capacity_bucket['Bucket Name']])
-            writer.writerow(['Total Size (Bytes)', highest_capacity_bucket['Total Size (Bytes)']])
-            writer.writerow(['Total Size (GB)', round(highest_capacity_bucket['Total Size (Bytes)'] / (1024**3), 2)])
-            writer.writerow(['Object Count', highest_capacity_bucket['Object Count']])
-            
-            # Add a note if it's the same bucket
+        largest_bucket = stats.largest_bucket
+        highest_capacity_bucket = stats.highest_capacity_bucket
+        if largest_bucket is not None:
+            stats_rows = [
+                [''],
+                ['Largest Bucket (by object count)'],
+                ['Bucket Name', largest_bucket['Bucket Name']],
+                ['Object Count', largest_bucket['Object Count']],
+                ['Total Size (Bytes)', largest_bucket['Total Size (Bytes)']],
+                ['Total Size (GB)', round(largest_bucket['Total Size (Bytes)'] / (1024**3), 2)],
+                [''],
+                ['Highest Capacity Bucket (by size)'],
+                ['Bucket Name', highest_capacity_bucket['Bucket Name']],
+                ['Total Size (Bytes)', highest_capacity_bucket['Total Size (Bytes)']],
+                ['Total Size (GB)', round(highest_capacity_bucket['Total Size (Bytes)'] / (1024**3), 2)],
+                ['Object Count', highest_capacity_bucket['Object Count']],
+            ]
             if largest_bucket['Bucket Name'] == highest_capacity_bucket['Bucket Name']:
-                writer.writerow(['Note:', 'This is also the bucket with the most objects'])
+                stats_rows.append(['Note:', 'This is also the bucket with the most objects'])
+            writer.writerows(stats_rows)
+
+    return stats
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def format_size(size_bytes):
     """Convert size in bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0 or unit == 'TB':
-            if unit == 'B':
-                return f"{int(size_bytes):,} {unit}"
-            return f"{size_bytes:,.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:,.1f} PB"
+    # bit_length indexes straight into the unit table (each unit spans 10
+    # bits), replacing the divide-until-small loop with one shift.
+    size_bytes = int(size_bytes)
+    index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if index == 0:
+        return f"{size_bytes:,} B"
+    return f"{size_bytes / (1 << (index * 10)):,.1f} {_SIZE_UNITS[index]}"
 
 def print_console_summary(summary, account_id=None, csv_stats=None):
-    """Print a summary of the S3 usage to the console."""
+    """Print a summary of the S3 usage to the console.
+
+    Args:
+        summary (list): List of bucket summaries
+        account_id (str, optional): AWS account ID
+        csv_stats (SummaryStats, optional): Totals already aggregated while
+            writing the CSV; aggregated here when not supplied so both
+            reports always come from the same numbers.
+    """
     if not summary and not csv_stats:
         print("No S3 buckets found or accessible.")
         return
-    
-    if csv_stats:
-        # Use stats from CSV writing if available (more accurate for storage class sizes)
-        total_buckets = csv_stats['total_buckets']
-        total_objects = csv_stats['total_objects']
-        total_size = csv_stats['total_size']
-        storage_class_objects = csv_stats['storage_class_objects']
-        storage_class_sizes = csv_stats['storage_class_sizes']
-    else:
-        # Fallback to calculating from summary
-        total_buckets = len(summary)
-        total_objects = sum(entry['Object Count'] for entry in summary)
-        total_size = sum(entry['Total Size (Bytes)'] for entry in summary)
-        
-        # Calculate storage class distribution (object counts only)
-        storage_class_objects = defaultdict(int)
-        storage_class_sizes = defaultdict(int)
-        
-        for entry in summary:
-            bucket_size = entry['Total Size (Bytes)']
-            bucket_objects = entry['Object Count']
-            storage_classes = entry['Storage Classes']
-            
-            if storage_classes and bucket_objects > 0:
-                for sc, count in storage_classes.items():
-                    storage_class_objects[sc] += count
-                    # Estimate size proportionally
-                    proportion = count / bucket_objects
-                    storage_class_sizes[sc] += int(bucket_size * proportion)
-            else:
-                storage_class_objects['STANDARD'] += bucket_objects
-                storage_class_sizes['STANDARD'] += bucket_size
-    
-    # Find largest bucket by object count
-    largest_bucket = None
-    if summary:
-        largest_bucket = max(summary, key=lambda x: x['Object Count'])
-    
+
+    stats = csv_stats if csv_stats is not None else _aggregate(summary)
+
     # Print summary
     if account_id:
         print(f"\nAWS Account: {account_id}")
-    
+
     print("\n=== S3 Storage Summary ===")
-    print(f"Total Buckets: {total_buckets:,}")
-    print(f"Total Objects: {total_objects:,}")
-    print(f"Total Size: {format_size(total_size)}")
-    
+    print(f"Total Buckets: {stats.total_buckets:,}")
+    print(f"Total Objects: {stats.total_objects:,}")
+    print(f"Total Size: {format_size(stats.total_size)}")
+
     print("\nStorage Class Distribution:")
-    for sc in sorted(storage_class_objects.keys()):
-        count = storage_class_objects[sc]
-        size = storage_class_sizes[sc]
+    for sc in sorted(stats.storage_class_objects.keys()):
+        count = stats.storage_class_objects[sc]
+        size = stats.storage_class_sizes[sc]
         print(f"  {sc}: {count:,} objects ({format_size(size)})")
-    
-    if csv_stats and 'highest_capacity_bucket' in csv_stats and csv_stats['highest_capacity_bucket']:
-        hc_bucket = csv_stats['highest_capacity_bucket']
+
+    hc_bucket = stats.highest_capacity_bucket
+    if hc_bucket:
         print(f"\nHighest Capacity Bucket (by size): {hc_bucket['Bucket Name']}")
         print(f"  Size: {format_size(hc_bucket['Total Size (Bytes)'])}")
         print(f"  Objects: {hc_bucket['Object Count']:,}")
-    
+
+    largest_bucket = stats.largest_bucket
     if largest_bucket:
         print(f"\nLargest Bucket (by object count): {largest_bucket['Bucket Name']}")
         print(f"  Objects: {largest_bucket['Object Count']:,}")
         print(f"  Size: {format_size(largest_bucket['Total Size (Bytes)'])}")
-        
+
         # If the largest bucket by object count is also the highest capacity, show a note
-        if (csv_stats and 'highest_capacity_bucket' in csv_stats and 
-            largest_bucket['Bucket Name'] == csv_stats['highest_capacity_bucket']['Bucket Name']):
+        if hc_bucket and largest_bucket['Bucket Name'] == hc_bucket['Bucket Name']:
             print("  (This is also the highest capacity bucket)")
-    
+
     print("=" * 25)
 
 if __name__ == "__main__":
@@ -374,12 +868,23 @@ if __name__ == "__main__":
         # Set up command line argument parsing
         parser = argparse.ArgumentParser(description='Generate a summary of S3 bucket usage.')
         parser.add_argument('--profile', type=str, help='AWS profile name to use (default: default profile)')
+        parser.add_argument('--workers', type=int, default=MAX_BUCKET_WORKERS,
+                            help=f'Number of buckets to process concurrently (default: {MAX_BUCKET_WORKERS})')
+        parser.add_argument('--inventory-bucket', type=str,
+                            help='Bucket receiving S3 Inventory reports; buckets with a report there are summarized from it')
+        parser.add_argument('--inventory-prefix', type=str, default='',
+                            help='Delivery prefix for the S3 Inventory reports')
+        parser.add_argument('--region', type=str,
+                            help='Only summarize buckets in this region (filtered server-side by ListBuckets)')
         args = parser.parse_args()
-        
+
         print("Starting S3 bucket summary...")
-        
+
         # Get the summary using the specified profile or default
-        summary, account_id = get_s3_summary(profile_name=args.profile)
+        summary, account_id = get_s3_summary(profile_name=args.profile, max_workers=args.workers,
+                                             inventory_bucket=args.inventory_bucket,
+                                             inventory_prefix=args.inventory_prefix,
+                                             region=args.region)
         if summary is not None:  # Check if we got a valid response (could be empty list)
             print("Writing summary to CSV...")
             # Get stats from CSV writing to ensure consistency